@@ -7,16 +7,24 @@
 # - Robust link splitting and wide tables retained.
 
 from __future__ import annotations
-import argparse, csv, html, re, shutil
+import argparse, csv, filecmp, hashlib, io, json, multiprocessing, os, pickle, re, shutil, sys, tarfile, threading, time, zipfile
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, List, Tuple, Optional, Set
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 import yaml  # pip install pyyaml
+try:  # libyaml-backed loader (bundled with the PyYAML wheels), several times faster
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
 
 _LOGO_SRC: Optional[str] = None
 
 # ─────────────────────────── Data model ───────────────────────────
-@dataclass
+@dataclass(slots=True)
 class ModuleInfo:
     name: str
     abbrev: str
@@ -24,8 +32,13 @@ class ModuleInfo:
     link: Optional[str] = None
     qual_link: Optional[str] = None
     parent_abbrev: Optional[str] = None
+    # External-link buttons shown on every page of this module; built once.
+    links_html: str = field(default="", init=False, repr=False)
 
-@dataclass
+    def __post_init__(self) -> None:
+        self.links_html = _module_links_html(self.link, self.qual_link)
+
+@dataclass(slots=True)
 class Requirement:
     external_id: str
     abbrev: str
@@ -33,10 +46,37 @@ class Requirement:
     counter: str
     heading: str
     text: str
-    incoming: List[str] = field(default_factory=list)
-    outgoing: List[str] = field(default_factory=list)
-
-@dataclass
+    outgoing: Tuple[str, ...] = ()
+    # Outgoing links split by kind; filled in by Project.build_graph().
+    out_req_ids: Tuple[str, ...] = ()
+    out_test_ids: Tuple[str, ...] = ()
+    out_xref_ids: Tuple[str, ...] = ()  # every non-test link, broken ones included
+    # Escaped/derived strings reused by every page that shows this requirement.
+    eid_esc: str = field(default="", init=False, repr=False)
+    heading_esc: str = field(default="", init=False, repr=False)
+    url: str = field(default="", init=False, repr=False)
+    tip: str = field(default="", init=False, repr=False)
+    # Link to this requirement's page minus the "<a href='" + prefix, which depends on page depth.
+    link_tail: str = field(default="", init=False, repr=False)
+    text_trunc180_esc: str = field(default="", init=False, repr=False)
+    # This requirement's row in other requirements' Incoming/Outgoing tables, after "<tr><td><a href='" + prefix.
+    xref_tail: str = field(default="", init=False, repr=False)
+    # Numeric counter for sorting (-1 when the counter is not all digits).
+    counter_int: int = field(default=-1, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.counter_int = int(self.counter) if self.counter.isdigit() else -1
+        self.eid_esc = escape(self.external_id)
+        self.heading_esc = escape(self.heading)
+        self.url = requirement_url(self.external_id)
+        self.tip = make_tip(self)
+        self.link_tail = f"{self.url}' title='{self.tip}'>{self.eid_esc}</a>"
+        self.text_trunc180_esc = escape(truncate(self.text, 180))
+        self.xref_tail = f"{self.link_tail}</td><td>{self.heading_esc}</td><td>{escape(truncate(self.text, 200))}</td></tr>"
+
+_TEST_ROW = "<tr><td>{}</td><td>{}</td><td>{}</td><td>{}</td></tr>"
+
+@dataclass(slots=True)
 class TestCase:
     external_id: str
     abbrev: str
@@ -44,8 +84,20 @@ class TestCase:
     text: str
     result: str = "Not Run"
     additional: str = ""
+    # The test's row in the requirement pages' test tables; it depends only on the test, so build it once.
+    row_html: str = field(default="", init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.row_html = _TEST_ROW.format(escape(self.external_id), badge(self.result),
+                                         escape(truncate(self.text, 160)), escape(truncate(self.additional, 160)))
+
+# Shared (read-only) rollup for requirements whose whole subtree links no tests.
+_NO_TESTS_ROLLUP: Tuple[str, Dict[str, int], List[str]] = ("No Tests", {}, [])
 
-@dataclass
+_LEVEL_SORT_KEY = attrgetter("abbrev", "sd", "counter_int", "counter")
+_MODULE_SORT_KEY = attrgetter("sd", "counter_int", "counter")
+
+@dataclass(slots=True)
 class Project:
     project_name: str
     levels: List[str]
@@ -53,39 +105,141 @@ class Project:
     requirements: Dict[str, Requirement]
     tests: Dict[str, TestCase]
     req_children: Dict[str, List[str]] = field(default_factory=dict)
-    req_tests: Dict[str, List[str]] = field(default_factory=dict)
+    req_tests: Dict[str, Tuple[str, ...]] = field(default_factory=dict)
+    # Parents of each requirement, inverted from the outgoing links (the CSV's IncomingLinks is not trusted).
+    req_incoming: Dict[str, List[str]] = field(default_factory=dict)
+    # Requirements grouped (and sorted) once for the level and edit pages.
+    by_level: Dict[str, List[Requirement]] = field(default_factory=dict)
+    by_module: Dict[str, List[Requirement]] = field(default_factory=dict)
+    # Frozen: one set is shared by every member of a cycle, so callers must not be able to mutate it.
+    _desc_cache: Dict[str, FrozenSet[str]] = field(default_factory=dict, init=False, repr=False)
+    _rollup_cache: Dict[str, Tuple[str, Dict[str, int], List[str]]] = field(default_factory=dict, init=False, repr=False)
+    # Whether a requirement or anything below it links a test; lets tests_rollup skip test-less subtrees.
+    _has_tests: Dict[str, bool] = field(default_factory=dict, init=False, repr=False)
+    # Result tally of each requirement's directly linked tests; rollups add these up.
+    _direct_counts: Dict[str, Counter] = field(default_factory=dict, init=False, repr=False)
 
     def build_graph(self) -> None:
-        self.req_children = {rid: [] for rid in self.requirements}
-        self.req_tests = {rid: [] for rid in self.requirements}
-        for rid, req in self.requirements.items():
+        self._desc_cache.clear()
+        self._rollup_cache.clear()
+        self._has_tests.clear()
+        self.req_children = {}
+        self.req_tests = {}
+        reqs = self.requirements
+        for rid, req in reqs.items():
+            # One pass over the links, classifying each target once.
+            out_reqs: List[str] = []; out_tests: List[str] = []; xrefs: List[str] = []; kids: List[str] = []
             for tgt in req.outgoing:
+                is_req = tgt in reqs
+                if is_req: out_reqs.append(tgt)
                 if is_test_id(tgt):
-                    self.req_tests[rid].append(tgt)
-                elif tgt in self.requirements:
-                    self.req_children[rid].append(tgt)
-
-    def descendants(self, rid: str) -> Set[str]:
-        seen: Set[str] = set()
-        stack = list(self.req_children.get(rid, []))
-        while stack:
-            cur = stack.pop()
-            if cur in seen: continue
-            seen.add(cur)
-            stack.extend(self.req_children.get(cur, []))
-        return seen
+                    out_tests.append(tgt)
+                else:
+                    xrefs.append(tgt)
+                    if is_req: kids.append(tgt)
+            req.out_req_ids, req.out_test_ids, req.out_xref_ids = tuple(out_reqs), tuple(out_tests), tuple(xrefs)
+            self.req_tests[rid] = req.out_test_ids
+            self.req_children[rid] = kids
+        tests = self.tests
+        self._direct_counts = {
+            rid: Counter(((tc.result.strip() or "Not Run") if (tc := tests.get(tid)) else "Missing") for tid in tids)
+            for rid, tids in self.req_tests.items() if tids
+        }
+        self.req_incoming = {rid: [] for rid in self.requirements}
+        for rid, kids in self.req_children.items():
+            for c in dict.fromkeys(kids): self.req_incoming[c].append(rid)
+        self.group_requirements()
+        self.precompute_descendants()
+
+    def group_requirements(self) -> None:
+        by_module: Dict[str, List[Requirement]] = defaultdict(list)
+        for req in self.requirements.values(): by_module[req.abbrev].append(req)
+        # Levels come from modules, so resolve each module once rather than once per requirement.
+        by_level: Dict[str, List[Requirement]] = defaultdict(list, {l: [] for l in self.levels})
+        for mod, lst in by_module.items():
+            m = self.modules.get(mod)
+            if m: by_level[m.level].extend(lst)
+        for lst in by_level.values(): lst.sort(key=_LEVEL_SORT_KEY)
+        for lst in by_module.values(): lst.sort(key=_MODULE_SORT_KEY)
+        # Plain dicts again, so later lookups can't silently add keys.
+        self.by_level, self.by_module = dict(by_level), dict(by_module)
+
+    def precompute_descendants(self) -> None:
+        """Fill the descendant cache for every requirement, reusing each finished set.
+
+        Tarjan's algorithm (iterative) emits strongly connected components children
+        first, so a component's set is the union of its members' out-of-component
+        children and their already-finished sets.  Every member of a cycle reaches
+        the same requirements, so the whole component shares one set.
+        """
+        children = self.req_children
+        desc = self._desc_cache
+        has_tests = self._has_tests; req_tests = self.req_tests
+        index: Dict[str, int] = {}
+        low: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        comp_stack: List[str] = []
+        for root in children:
+            if root in index: continue
+            index[root] = low[root] = len(index)
+            comp_stack.append(root); on_stack.add(root)
+            work = [(root, iter(children[root]))]
+            while work:
+                v, it = work[-1]
+                for w in it:
+                    if w not in index:
+                        index[w] = low[w] = len(index)
+                        comp_stack.append(w); on_stack.add(w)
+                        work.append((w, iter(children[w])))
+                        break
+                    if w in on_stack and index[w] < low[v]: low[v] = index[w]
+                else:
+                    work.pop()
+                    if work and low[v] < low[work[-1][0]]: low[work[-1][0]] = low[v]
+                    if low[v] != index[v]: continue
+                    comp: List[str] = []
+                    while True:
+                        w = comp_stack.pop(); on_stack.discard(w); comp.append(w)
+                        if w == v: break
+                    members = set(comp)
+                    cyclic = len(comp) > 1
+                    acc: Set[str] = set()
+                    any_tests = False
+                    for u in comp:
+                        if req_tests[u]: any_tests = True
+                        for c in children[u]:
+                            if c in members: cyclic = True  # includes self-links
+                            else:
+                                acc.add(c)
+                                acc |= desc[c]
+                                if has_tests[c]: any_tests = True
+                    if cyclic: acc |= members
+                    frozen = frozenset(acc)
+                    for u in comp:
+                        desc[u] = frozen
+                        has_tests[u] = any_tests
+
+    def descendants(self, rid: str) -> FrozenSet[str]:
+        cached = self._desc_cache.get(rid)
+        return cached if cached is not None else frozenset()
 
     def tests_rollup(self, rid: str) -> Tuple[str, Dict[str, int], List[str]]:
-        ids: List[str] = []
-        ids.extend(self.req_tests.get(rid, []))
+        # Called from both the level and requirement pages; compute once per rid.
+        cached = self._rollup_cache.get(rid)
+        if cached is not None: return cached
+        if not self._has_tests.get(rid):
+            return _NO_TESTS_ROLLUP
+        # Sum the per-requirement tallies over the subtree instead of re-resolving every test.
+        req_tests = self.req_tests; direct = self._direct_counts
+        ids: List[str] = list(req_tests.get(rid, ()))
+        counts: Dict[str, int] = Counter(direct.get(rid, ()))
         for child in self.descendants(rid):
-            ids.extend(self.req_tests.get(child, []))
-        counts: Dict[str, int] = {}
-        for tid in ids:
-            tc = self.tests.get(tid)
-            res = (tc.result if tc else "Missing").strip() or "Not Run"
-            counts[res] = counts.get(res, 0) + 1
+            tids = req_tests.get(child)
+            if tids:
+                ids.extend(tids)
+                counts.update(direct[child])
         label = summarize_counts(counts, len(ids))
+        self._rollup_cache[rid] = (label, counts, ids)
         return label, counts, ids
 
 # ─────────────────────────── Helpers ───────────────────────────
@@ -249,17 +403,17 @@ STATS_CSS = """
 
 
 def parse_external_id(eid: str):
-    parts = (eid or "").strip().split("-")
+    # maxsplit keeps any further dashes in the counter without a re-join
+    parts = (eid or "").strip().split("-", 2)
     if len(parts) < 3:
         raise ValueError(f"Invalid ExternalID: {eid}")
-    return parts[0], parts[1], "-".join(parts[2:])
+    return parts[0], parts[1], parts[2]
 
+@lru_cache(maxsize=None)
 def is_test_id(eid: str) -> bool:
-    try:
-        _, sd, _ = parse_external_id(eid)
-        return sd == "AT"
-    except Exception:
-        return False
+    # Same answer as parse_external_id(eid)[1] == "AT", without the split or exception path.
+    # Cached: the same test IDs are linked from many requirements.
+    return (eid or "").strip().partition("-")[2].startswith("AT-")
 
 def summarize_counts(counts: Dict[str, int], total: int) -> str:
     if total == 0: return "No Tests"
@@ -269,14 +423,15 @@ def summarize_counts(counts: Dict[str, int], total: int) -> str:
     if counts.get("PASSED",0) == total: return "PASSED"
     return "Mixed"
 
+# "_" is itself outside [a-z0-9], so one substitution already leaves no runs of "_".
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
 def slug(s: str) -> str:
-    s = s.strip().lower()
-    s = re.sub(r"[^a-z0-9]+", "_", s)
-    return re.sub(r"_+", "_", s).strip("_")
+    return _SLUG_RE.sub("_", s.strip().lower()).strip("_")
 
-_SPLIT_RE = re.compile(r"[;,\s]+")
+# ";" and "," become spaces, then str.split() splits on any whitespace run and drops empties (same as re \s+).
+_LINK_SEPARATORS = str.maketrans(";,", "  ")
 def split_links(s: str) -> list[str]:
-    return [t for t in _SPLIT_RE.split(s or "") if t]
+    return s.translate(_LINK_SEPARATORS).split() if s else []
 
 # ADD this helper near the other small URL helpers
 def module_anchor_url(abbr: str) -> str:
@@ -284,15 +439,17 @@ def module_anchor_url(abbr: str) -> str:
     return f"{level_url('Module')}#mod-{abbr}"
 
 
-def module_links_html(mi: Optional[ModuleInfo]) -> str:
-    if not mi: return ""
+def _module_links_html(link: Optional[str], qual_link: Optional[str]) -> str:
     parts = []
-    if getattr(mi, "link", ""):
-        parts.append(f"<a href='{mi.link}' target='_blank' class='btn-link'>📘 Requirements Page</a>")
-    if getattr(mi, "qual_link", ""):
-        parts.append(f"<a href='{mi.qual_link}' target='_blank' class='btn-link'>🧪 Qualification Results</a>")
+    if link:
+        parts.append(f"<a href='{link}' target='_blank' class='btn-link'>📘 Requirements Page</a>")
+    if qual_link:
+        parts.append(f"<a href='{qual_link}' target='_blank' class='btn-link'>🧪 Qualification Results</a>")
     return f"<div class='module-links'>{' '.join(parts)}</div>" if parts else ""
 
+def module_links_html(mi: Optional[ModuleInfo]) -> str:
+    return mi.links_html if mi else ""
+
 # Trees
 def _build_module_forest(modules: Dict[str, ModuleInfo]) -> Dict[str, list[str]]:
     children: Dict[str, list[str]] = {k: [] for k in modules.keys()}
@@ -313,56 +470,91 @@ def _find_roots(modules: Dict[str, ModuleInfo]) -> list[str]:
     roots = sorted(list(all_abbrs - has_parent))
     return roots
 
-# ADD this internal-tree renderer (next to _render_tree_ul)
-def _render_req_tree_internal(modules: Dict[str, ModuleInfo]) -> str:
+def _tree_html(modules: Dict[str, ModuleInfo], head: Callable[[str], str]) -> str:
+    """<ul class='tree'> over the module forest, pre-order with an explicit stack (no recursion limit)."""
     children = _build_module_forest(modules)
-    roots = _find_roots(modules)
+    out = ["<ul class='tree'>"]
+    stack: List[Optional[str]] = _find_roots(modules)[::-1]  # None closes the enclosing node's <ul>
+    while stack:
+        abbr = stack.pop()
+        if abbr is None:
+            out.append("</ul></li>"); continue
+        kids = children.get(abbr)
+        if kids:
+            out.append(f"<li>{head(abbr)}<ul>")
+            stack.append(None); stack.extend(reversed(kids))
+        else:
+            out.append(f"<li>{head(abbr)}</li>")
+    out.append("</ul>")
+    return "".join(out)
 
-    def node_html(abbr: str) -> str:
-        m = modules[abbr]
-        label = f"{abbr} — {m.name}"
+# ADD this internal-tree renderer (next to _render_tree_ul)
+def _render_req_tree_internal(modules: Dict[str, ModuleInfo]) -> str:
+    def head(abbr: str) -> str:
+        label = f"{abbr} — {modules[abbr].name}"
         url = module_anchor_url(abbr)  # always point to our rendered Module section
-        head = f"<a href='{url}' class='tree-link'>{label}</a>"
-        kids = children.get(abbr, [])
-        if not kids:
-            return f"<li>{head}</li>"
-        inner = ''.join(node_html(k) for k in kids)
-        return f"<li>{head}<ul>{inner}</ul></li>"
-
-    html = ''.join(node_html(r) for r in roots)
-    return f"<ul class='tree'>{html}</ul>"
+        return f"<a href='{url}' class='tree-link'>{label}</a>"
+    return _tree_html(modules, head)
 
 
 def _render_tree_ul(modules: Dict[str, ModuleInfo], link_attr: str) -> str:
-    children = _build_module_forest(modules)
-    roots = _find_roots(modules)
-    def node_html(abbr: str) -> str:
+    def head(abbr: str) -> str:
         m = modules[abbr]
         url = getattr(m, link_attr, None) or ""
         url = module_links_html(m) and url or ""
         label = f"{abbr} — {m.name}"
         if url:
-            head = f"<a href='{url}' target='_blank' class='tree-link'>{label}</a>"
-        else:
-            head = f"<span class='tree-missing'>{label}</span>"
-        kids = children.get(abbr, [])
-        if not kids:
-            return f"<li>{head}</li>"
-        inner = ''.join(node_html(k) for k in kids)
-        return f"<li>{head}<ul>{inner}</ul></li>"
-    html = ''.join(node_html(r) for r in roots)
-    return f"<ul class='tree'>{html}</ul>"
+            return f"<a href='{url}' target='_blank' class='tree-link'>{label}</a>"
+        return f"<span class='tree-missing'>{label}</span>"
+    return _tree_html(modules, head)
 
 # ─────────────────────────── Loading ───────────────────────────
+def project_cache_dir() -> Path:
+    """Per-user cache folder. Never the exports or OUT: those are shared, and unpickling runs code."""
+    base = os.environ.get("LOCALAPPDATA") if os.name == "nt" else os.environ.get("XDG_CACHE_HOME")
+    return Path(base or Path.home()/".cache")/"doorslight"
+
+def _path_key(path: Path) -> str:
+    """Short stable key for a cache file belonging to one input path."""
+    return hashlib.sha1(os.fsencode(os.path.abspath(path))).hexdigest()[:16]
+
+def _load_hierarchy_data(path: Path) -> dict:
+    """Parse hierarchy.yaml, reusing a JSON copy in project_cache_dir() while the YAML is unchanged.
+
+    The copy is keyed by the SHA-1 of the YAML bytes rather than its mtime, so
+    edits that keep the timestamp (copies, checkouts) still invalidate it.
+    """
+    raw = path.read_bytes()
+    digest = hashlib.sha1(raw).hexdigest()
+    cache = project_cache_dir()/f"hierarchy-{_path_key(path)}.json"
+    try:
+        cached = json.loads(cache.read_bytes())
+        if cached.get("sha1") == digest: return cached["data"]
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass
+    data = yaml.load(raw, Loader=_YamlLoader)
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_name(cache.name + ".tmp")
+        tmp.write_text(json.dumps({"sha1": digest, "data": data}), encoding="utf-8")
+        os.replace(tmp, cache)
+    except (OSError, TypeError):
+        pass  # unwritable cache folder or non-JSON YAML values: just parse again next run
+    return data
+
+def _intern(v):
+    """sys.intern() for the small-domain strings (levels, abbrevs, results); other values pass through."""
+    return sys.intern(v) if type(v) is str else v
+
 def load_hierarchy(path: Path) -> Tuple[List[str], Dict[str, ModuleInfo]]:
-    data = yaml.safe_load(path.read_text(encoding="utf-8"))
-    levels: List[str] = data.get("levels") or []
+    data = _load_hierarchy_data(path)
+    levels: List[str] = [_intern(l) for l in data.get("levels") or []]
     modules: Dict[str, ModuleInfo] = {}
     for m in data.get("modules", []):
         mi = ModuleInfo(
             name=m["name"],
-            abbrev=m["abbrev"],
-            level=m["level"],
+            abbrev=_intern(m["abbrev"]),
+            level=_intern(m["level"]),
             link=m.get("link"),
             qual_link=m.get("qual_link"),
             parent_abbrev=m.get("parent_abbrev"),
@@ -375,71 +567,251 @@ def load_hierarchy(path: Path) -> Tuple[List[str], Dict[str, ModuleInfo]]:
         levels = seen
     return levels, modules
 
-def read_csv_rows(csv_path: Path):
-    rows = []
-    with csv_path.open(newline="", encoding="utf-8-sig", errors="replace") as f:
-        reader = csv.DictReader(f)
+# DOORS exports can embed long rich-text/OLE dumps in Object Text; the csv default caps a field at 128 KiB.
+# Capped at 2**31 - 1: sys.maxsize overflows the C long on Windows.
+_CSV_FIELD_LIMIT = min(sys.maxsize, 2**31 - 1)
+
+# Columns load_project actually reads; everything else in an export is skipped.
+_REQ_COLUMNS = ("Object Heading", "DataClass", "Object Identifier", "Object Text", "Outgoing Links")
+_REQ_DATACLASSES = frozenset(("Mandatory", "Desireable", "Derived"))
+_TEST_COLUMNS = ("Object Identifier", "Object Heading", "Object Text", "TestResult", "TestComment")
+
+def read_csv_rows_select(csv_path: Path, wanted: Sequence[str],
+                         defaults: Optional[Dict[str, str]] = None) -> Iterator[Tuple[str, ...]]:
+    """Yield one tuple per row holding just the ``wanted`` columns, stripped, in order.
+
+    Columns absent from the header come back as ``defaults.get(name, "")``.
+    """
+    defaults = defaults or {}
+    # Interpreter-wide csv setting, so it is applied when exports are read rather than on import.
+    if csv.field_size_limit() < _CSV_FIELD_LIMIT: csv.field_size_limit(_CSV_FIELD_LIMIT)
+    with open(csv_path, newline="", encoding="utf-8-sig", errors="replace", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None: return
+        pos = {h.strip(): i for i, h in enumerate(header)}
+        idx = [pos.get(c, -1) for c in wanted]
+        missing = [defaults.get(c, "") for c in wanted]
+        # Fast path for complete rows when every column is present: one C-level pick + strip.
+        pick = itemgetter(*idx) if len(idx) > 1 and min(idx) >= 0 else None
+        need = max(idx, default=-1) + 1
+        strip = str.strip
         for row in reader:
-            rows.append({(k or "").strip(): (v or "").strip() for k, v in row.items()})
-    return rows
+            if not row: continue
+            n = len(row)
+            if pick is not None and n >= need:
+                yield tuple(map(strip, pick(row)))
+            else:
+                yield tuple((row[i].strip() if i < n else "") if i >= 0 else d for i, d in zip(idx, missing))
+
+def _iter_csv_entries(root: str) -> Iterator[os.DirEntry]:
+    """Yield DirEntry objects for *.csv files below root.
+
+    Symlinked directories are not followed (like rglob); hidden directories (.git, .cache, ...) are skipped.
+    """
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith("."): stack.append(entry.path)
+                elif entry.name[-4:].lower() == ".csv" and entry.is_file():
+                    yield entry
 
 def discover_module_files(exports_root: Path):
     req_files, test_files = [], []
-    for p in exports_root.rglob("*.csv"):
-        if (("requirement" in p.name.lower() or "specification" in p.name.lower()) and p.suffix.lower() == ".csv"):
-            req_files.append(p)
-        elif ("test" in p.name.lower() and p.suffix.lower() == ".csv"):
-            test_files.append(p)
+    for entry in _iter_csv_entries(str(exports_root)):
+        name = entry.name.lower()
+        if "requirement" in name or "specification" in name:
+            req_files.append(Path(entry.path))
+        elif "test" in name:
+            test_files.append(Path(entry.path))
     return sorted(req_files), sorted(test_files)
 
-def load_project(exports_root: Path, hierarchy_path: Path, project_name: str) -> Project:
+def _parse_requirement_file(path: Path) -> List[Requirement]:
+    out: List[Requirement] = []
+    for theHeader, dataclass, eid, text, out_links in read_csv_rows_select(path, _REQ_COLUMNS):
+        # Heading rows and non-requirement classes are most of an export; drop them before any parsing.
+        if theHeader or dataclass not in _REQ_DATACLASSES or not eid: continue
+        eid = sys.intern(eid)
+        mod, sd, counter = parse_external_id(eid)
+        mod = _intern(mod); sd = _intern(sd)
+        # Interned, so each link target is the same object as the ID it points at.
+        outgoing = tuple(map(sys.intern, split_links(out_links)))
+        out.append(Requirement(
+            external_id=eid, abbrev=mod, sd=sd, counter=counter,
+            heading=theHeader, text=text,
+            outgoing=outgoing,
+        ))
+    return out
+
+def _parse_test_file(path: Path) -> List[TestCase]:
+    out: List[TestCase] = []
+    for eid, heading, text, result, comment in read_csv_rows_select(path, _TEST_COLUMNS, {"TestResult": "Not Run"}):
+        if not eid: continue
+        mod, sd, counter = parse_external_id(eid)
+        if sd != "AT": continue
+        eid = sys.intern(eid)
+        out.append(TestCase(
+            external_id=eid, abbrev=_intern(mod), counter=counter,
+            text=heading + text, result=_intern(result),
+            additional=comment,
+        ))
+    return out
+
+def load_project(exports_root: Path, hierarchy_path: Path, project_name: str, jobs: int = 1) -> Project:
     levels, modules = load_hierarchy(hierarchy_path)
     req_files, test_files = discover_module_files(exports_root)
     requirements: Dict[str, Requirement] = {}
     tests: Dict[str, TestCase] = {}
 
-    for rf in req_files:
-        for row in read_csv_rows(rf):
-            theHeader = row.get("Object Heading", "")
-            if theHeader == "":
-                dataclass = row.get("DataClass", "")
-                if dataclass in ("Mandatory", "Desireable", "Derived"):
-                    eid = row.get("Object Identifier", "")
-                    if not eid: continue
-                    mod, sd, counter = parse_external_id(eid)
-                    incoming = split_links(row.get("Incoming Links", ""))
-                    outgoing = split_links(row.get("Outgoing Links", ""))
-                    requirements[eid] = Requirement(
-                        external_id=eid, abbrev=mod, sd=sd, counter=counter,
-                        heading=row.get("Object Heading", ""), text=row.get("Object Text", ""),
-                        incoming=incoming, outgoing=outgoing,
-                    )
-
-    for tf in test_files:
-        for row in read_csv_rows(tf):
-            eid = row.get("Object Identifier", "")
-            if not eid: continue
-            mod, sd, counter = parse_external_id(eid)
-            if sd != "AT": continue
-            tests[eid] = TestCase(
-                external_id=eid, abbrev=mod, counter=counter,
-                text=row.get("Object Heading","") + row.get("Object Text", ""), result=row.get("TestResult", "Not Run"),
-                additional=row.get("TestComment", ""),
-            )
+    # Parse files concurrently; merge in sorted file order so later files still win on duplicate IDs.
+    # Threads overlap the reads; with --jobs the CPU-bound parsing moves to processes instead
+    # (worth it once the parse outweighs pickling the parsed rows back).
+    n_files = len(req_files) + len(test_files)
+    if jobs > 1 and n_files > 1:
+        ctx = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+        pool = ProcessPoolExecutor(min(jobs, n_files), mp_context=ctx)
+    else:
+        pool = ThreadPoolExecutor(max_workers=max(1, min(32, n_files)))
+    with pool as ex:
+        req_parts = ex.map(_parse_requirement_file, req_files)
+        test_parts = ex.map(_parse_test_file, test_files)
+        for part in req_parts:
+            for r in part: requirements[r.external_id] = r
+        for part in test_parts:
+            for t in part: tests[t.external_id] = t
 
     proj = Project(project_name=project_name, levels=levels, modules=modules, requirements=requirements, tests=tests)
     proj.build_graph()
     return proj
 
+def _project_fingerprint(exports_root: Path, hierarchy_path: Path) -> str:
+    """SHA-1 over this script and every input load_project reads (relative path + bytes)."""
+    h = hashlib.sha1(Path(__file__).read_bytes())
+    req_files, test_files = discover_module_files(exports_root)
+    for p in [hierarchy_path, *req_files, *test_files]:
+        h.update(os.fsencode(os.path.relpath(p, exports_root)) + b"\0")
+        h.update(p.read_bytes())
+    return h.hexdigest()
+
+def load_project_cached(exports_root: Path, hierarchy_path: Path, project_name: str, jobs: int = 1) -> Project:
+    """load_project(), reusing a pickled Project from project_cache_dir() while no input changed.
+
+    Like the hierarchy JSON copy, the cache is keyed by content hash, not mtimes;
+    there is one cache file per exports folder.
+    """
+    digest = _project_fingerprint(exports_root, hierarchy_path)
+    cache = project_cache_dir()/f"project-{_path_key(exports_root)}.pkl"
+    try:
+        with open(cache, "rb") as f:
+            if pickle.load(f) == digest:
+                proj = pickle.load(f)
+                proj.project_name = project_name
+                return proj
+    except (OSError, EOFError, pickle.PickleError, AttributeError, ImportError, TypeError, ValueError):
+        pass
+    proj = load_project(exports_root, hierarchy_path, project_name, jobs)
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache.with_name(cache.name + ".tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(digest, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(proj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, cache)
+    except (OSError, pickle.PicklingError, RecursionError):
+        pass  # unwritable cache folder: just parse again next run
+    return proj
+
+# ─────────────────────────── Output sink ───────────────────────────
+class ArchiveSink:
+    """Collects the site into one archive (--bundle) instead of thousands of small files."""
+    def __init__(self, archive: Path, out_root: Path):
+        archive.parent.mkdir(parents=True, exist_ok=True)
+        self.out_root = out_root
+        self._lock = threading.Lock()  # pages are written from a thread pool
+
+    def arcname(self, path: str | Path) -> str:
+        return Path(path).relative_to(self.out_root).as_posix()
+
+class ZipSink(ArchiveSink):
+    def __init__(self, archive: Path, out_root: Path):
+        super().__init__(archive, out_root)
+        self._zf = zipfile.ZipFile(archive, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1)
+
+    def write(self, path: str | Path, data: bytes) -> None:
+        info = zipfile.ZipInfo(self.arcname(path), date_time=(1980, 1, 1, 0, 0, 0))
+        info.compress_type = zipfile.ZIP_DEFLATED
+        info.external_attr = 0o644 << 16
+        with self._lock: self._zf.writestr(info, data, compresslevel=1)
+
+    def write_file(self, path: Path, src: Path) -> None:
+        with self._lock: self._zf.write(src, self.arcname(path))
+
+    def close(self) -> None:
+        self._zf.close()
+
+class TarSink(ArchiveSink):
+    """Uncompressed tar: one sequential stream, nothing to deflate."""
+    def __init__(self, archive: Path, out_root: Path):
+        super().__init__(archive, out_root)
+        self._tf = tarfile.open(archive, "w", format=tarfile.PAX_FORMAT)
+
+    def write(self, path: str | Path, data: bytes) -> None:
+        info = tarfile.TarInfo(self.arcname(path))
+        info.size = len(data); info.mode = 0o644
+        with self._lock: self._tf.addfile(info, io.BytesIO(data))
+
+    def write_file(self, path: Path, src: Path) -> None:
+        with self._lock: self._tf.add(src, self.arcname(path), recursive=False)
+
+    def close(self) -> None:
+        self._tf.close()
+
+_SINKS = {"zip": ZipSink, "tar": TarSink}
+
+# Set by main() for --bundle; None means pages go straight to the filesystem.
+_SINK: Optional[ArchiveSink] = None
+
 # ─────────────────────────── Rendering utils ───────────────────────────
+# Output directories already created during this build; thousands of pages share a handful of them.
+# Plain str paths from here on: the per-page hot path avoids building PurePath objects.
+_DIRS_CREATED: Set[str] = set()
+
+def ensure_dir(d: str) -> None:
+    # d is "" for files directly in a relative OUT such as "--out ."; nothing to create.
+    if d and d not in _DIRS_CREATED:
+        os.makedirs(d, exist_ok=True)
+        _DIRS_CREATED.add(d)
+
 def write_text(path: Path, content: str):
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    if _SINK is not None: return _SINK.write(path, content.encode("utf-8"))
+    ensure_dir(os.path.dirname(path))
+    path.write_bytes(content.encode("utf-8"))
 
-def escape(s: str) -> str: return html.escape(s, quote=True)
+def copy_asset(src: Path, dest: Path) -> None:
+    """Copy src to dest unless dest already holds the same bytes (repeat builds, or a --logo inside OUT)."""
+    if _SINK is not None: return _SINK.write_file(dest, src)
+    try:
+        if filecmp.cmp(src, dest, shallow=False): return
+    except OSError:
+        pass  # no previous copy
+    ensure_dir(os.path.dirname(dest))
+    shutil.copyfile(src, dest)
+
+# Same mapping as html.escape(s, quote=True), applied in one C-level pass.
+_HTML_ESCAPE_TABLE = str.maketrans({"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"})
+
+def escape(s: str) -> str: return s.translate(_HTML_ESCAPE_TABLE)
+
+_NEWLINES_TO_SPACE = str.maketrans("\r\n", "  ")
 
 def truncate(s: str, n:int=320) -> str:
-    s=(s or '').strip().replace('\r',' ').replace('\n',' ')
+    s=(s or '').translate(_NEWLINES_TO_SPACE).strip()
     return (s[:n]+"…") if len(s)>n else s
 
 def make_tip(req: Optional[Requirement]) -> str:
@@ -449,6 +821,7 @@ def make_tip(req: Optional[Requirement]) -> str:
         combo = (combo+" — "+req.text) if combo else req.text
     return escape(truncate(combo, 400))
 
+@lru_cache(maxsize=256)
 def badge(label: str) -> str:
     cls = {
         "All Pass":"badge pass","Any Fail":"badge fail","Has Not Run":"badge warn",
@@ -460,10 +833,11 @@ def requirement_url(eid: str) -> str: return f"requirements/{eid.replace('/', '_
 
 def module_edit_url(mod: str) -> str: return f"edit/edit-{mod}.html"
 
+@lru_cache(maxsize=None)
 def level_url(level: str) -> str: return f"levels/{slug(level)}.html"
 
 # Inline JS
-DEFAULT_INLINE_JS = r"""
+DEFAULT_JS = r"""
 (function(){
   try{ document.documentElement.setAttribute('data-js','on'); }catch(e){}
   var root=document.documentElement; var btn=document.getElementById('themeToggle');
@@ -479,53 +853,85 @@ DEFAULT_INLINE_JS = r"""
 """
 
 # Shared layout
-# === Update your layout() or global CSS injection to include STATS_CSS once ===
-def layout(title: str, body: str, project_name: str, levels: list[str], depth: int) -> str:
+@lru_cache(maxsize=None)
+def _layout_static(project_name: str, levels: Tuple[str, ...], depth: int, logo_src: Optional[str]) -> Tuple[str, str, str]:
+    """Static frame of layout() for one depth: (text before the title, after the title, after the body)."""
     # Compute relative prefix for assets/links
     p = "../" * max(0, int(depth))
+    project_esc = escape(project_name)
 
     # Top nav: links to each level page
     nav_links = " ".join(f"<a href='{p}{level_url(l)}'>{escape(l)}</a>" for l in levels)
 
     # Optional logo
-    logo = f"<img class='logo' src='{p}{_LOGO_SRC}' alt='Logo' />" if _LOGO_SRC else ""
-
-    # Styles: external main CSS + inline stats CSS
-    styles = f"""
-    <link rel="stylesheet" href="{p}style.css" />
-    <style>
-      {STATS_CSS}
-    </style>
-    """
+    logo = f"<img class='logo' src='{p}{logo_src}' alt='Logo' />" if logo_src else ""
 
-    # Return a full HTML document
-    return f"""<!doctype html>
+    # Styles: one shared stylesheet (main + stats CSS), cached by the browser across pages.
+    # The script is deferred: fetched in parallel with parsing, run once the DOM is complete.
+    styles = f"""<link rel="stylesheet" href="{p}style.css" />
+  <script src="{p}script.js" defer></script>"""
+
+    before_title = f"""<!doctype html>
 <html lang="en">
 <head>
   <meta charset="utf-8" />
   <meta name="viewport" content="width=device-width,initial-scale=1" />
-  <title>{escape(project_name)} — {escape(title)}</title>
+  <title>{project_esc} — """
+    after_title = f"""</title>
   {styles}
 </head>
 <body>
   <header class="site-header">
-    <div class="brand">{logo}<span>{escape(project_name)}</span></div>
+    <div class="brand">{logo}<span>{project_esc}</span></div>
     <nav class="nav">{nav_links}</nav>
     <button id="themeToggle" class="btn" title="Toggle dark/light">☀️</button>
   </header>
 
   <main class="container">
-    {body}
+    """
+    after_body = f"""
   </main>
 
   <footer class="site-footer">
-    <div class="muted small">Generated by DOORsLight • {escape(project_name)}</div>
-    <div class="muted small">Theme + filter JS is inline</div>
+    <div class="muted small">Generated by DOORsLight • {project_esc}</div>
+    <div class="muted small">Theme + filter JS: script.js</div>
   </footer>
-
-  <script>{DEFAULT_INLINE_JS}</script>
 </body>
 </html>"""
+    return before_title, after_title, after_body
+
+def _frame(project_name: str, levels: Sequence[str], depth: int) -> Tuple[str, str, str]:
+    return _layout_static(project_name, levels if type(levels) is tuple else tuple(levels), depth, _LOGO_SRC)
+
+def layout_head(title: str, project_name: str, levels: list[str], depth: int) -> str:
+    before_title, after_title, _ = _frame(project_name, levels, depth)
+    return before_title + escape(title) + after_title
+
+def layout_tail(project_name: str, levels: list[str], depth: int) -> str:
+    return _frame(project_name, levels, depth)[2]
+
+def layout(title: str, body: str, project_name: str, levels: list[str], depth: int) -> str:
+    return layout_head(title, project_name, levels, depth) + body + layout_tail(project_name, levels, depth)
+
+def page_bytes(title: str, project_name: str, levels: list[str], depth: int, body_parts: Iterable[str]) -> bytes:
+    # Whole page in memory, for archive members (--bundle) and pages returned by render workers.
+    before_title, after_title, after_body = _frame(project_name, levels, depth)
+    chunks = [before_title, escape(title), after_title]
+    chunks.extend(body_parts)
+    chunks.append(after_body)
+    return "".join(chunks).encode("utf-8")
+
+def write_layout_stream(path: str | Path, title: str, project_name: str, levels: list[str], depth: int,
+                        body_parts: Iterable[str]) -> None:
+    """Write a full page, streaming the body fragments straight into a buffered file."""
+    if _SINK is not None:
+        return _SINK.write(path, page_bytes(title, project_name, levels, depth, body_parts))
+    ensure_dir(os.path.dirname(path))
+    before_title, after_title, after_body = _frame(project_name, levels, depth)
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.write(before_title); f.write(escape(title)); f.write(after_title)
+        f.writelines(body_parts)
+        f.write(after_body)
 
 
 
@@ -570,190 +976,232 @@ def render_index(proj: Project, out_root: Path) -> None:
 
 
 
-def group_requirements_by_level(proj: Project) -> Dict[str, List[Requirement]]:
-    level_map: Dict[str, List[Requirement]] = {l: [] for l in proj.levels}
-    for req in proj.requirements.values():
-        m = proj.modules.get(req.abbrev)
-        if not m: continue
-        level_map.setdefault(m.level, []).append(req)
-    for lvl, lst in level_map.items():
-        lst.sort(key=lambda r:(r.abbrev, r.sd, int(r.counter) if r.counter.isdigit() else r.counter))
-    return level_map
-
-def render_level_pages(proj: Project, out_root: Path) -> None:
-    depth=1; p="../"
-    grouped = group_requirements_by_level(proj)
-    for lvl in proj.levels:
-        reqs = grouped.get(lvl, [])
-        # Module level: separate tables per module
-        if lvl.strip().lower() == "module":
-            by_mod: Dict[str, List[Requirement]] = {}
-            for r in reqs: by_mod.setdefault(r.abbrev, []).append(r)
-            jump = []
-            for mod in sorted(by_mod.keys()):
-                mi = proj.modules.get(mod)
-                jump.append(f"<a class='chip' href='#mod-{escape(mod)}'>{escape(mod)} — {escape(mi.name if mi else '')}</a>")
-            sections = []
-            for mod in sorted(by_mod.keys()):
-                mi = proj.modules.get(mod)
-                rows=[]
-                for r in by_mod[mod]:
-                    label,_,_=proj.tests_rollup(r.external_id)
-                    def link_html(eid: str) -> str:
-                        rr = proj.requirements.get(eid)
-                        tip = make_tip(rr)
-                        return f"<a href='{p}{requirement_url(eid)}' title='{tip}'>{escape(eid)}</a>" if rr else escape(eid)
-                    inc = " ".join(link_html(e) for e in r.incoming if e in proj.requirements)
-                    outs_req=[e for e in r.outgoing if e in proj.requirements]
-                    outs_tst=[e for e in r.outgoing if is_test_id(e)]
-                    outs_html = (f"<div><strong>Req:</strong> "+", ".join(link_html(e) for e in outs_req)+"</div>" if outs_req else "") \
-                                + (f"<div><strong>Tests:</strong> "+", ".join(escape(e) for e in outs_tst)+"</div>" if outs_tst else "")
-                    rows.append(
-                        f"<tr><td><a href='{p}{requirement_url(r.external_id)}'>{escape(r.external_id)}</a></td>"
-                        f"<td>{escape(r.heading)}</td><td>{escape(truncate(r.text,180))}</td>"
-                        f"<td>{inc}</td><td>{outs_html}</td><td>{badge(label)}</td></tr>"
-                    )
-                sections.append(f"""
-                <section id='mod-{escape(mod)}'>
-                  <h2>{escape(mod)} — {escape(mi.name if mi else '')}</h2>
+# Level-table row: link prefix, url, id, heading, text, incoming, outgoing, badge (all pre-escaped).
+_LEVEL_ROW = "<tr><td><a href='%s%s'>%s</a></td><td>%s</td><td>%s</td><td>%s</td><td>%s</td><td>%s</td></tr>"
+
+def _level_row(proj: Project, r: Requirement, p: str) -> str:
+    """One level-table row, filled into _LEVEL_ROW from pre-escaped pieces."""
+    rid = r.external_id
+    label,_,_=proj.tests_rollup(rid)
+    # req_incoming and out_req_ids only ever hold loaded requirement IDs, so index directly.
+    reqs = proj.requirements; a = "<a href='" + p
+    outgoing = ""
+    if r.out_req_ids:
+        outgoing = "<div><strong>Req:</strong> " + ", ".join([a + reqs[e].link_tail for e in r.out_req_ids]) + "</div>"
+    if r.out_test_ids:
+        outgoing += "<div><strong>Tests:</strong> " + escape(", ".join(r.out_test_ids)) + "</div>"
+    return _LEVEL_ROW % (p, r.url, r.eid_esc, r.heading_esc, r.text_trunc180_esc,
+                         " ".join([a + reqs[e].link_tail for e in proj.req_incoming[rid]]), outgoing, badge(label))
+
+def _rows_or_none(rows: Iterable[str], empty: str) -> Iterator[str]:
+    """Pass rows through, or yield the ``empty`` placeholder row if there were none."""
+    seen = False
+    for row in rows:
+        seen = True
+        yield row
+    if not seen: yield empty
+
+def _module_level_parts(proj: Project, lvl: str, reqs: List[Requirement], p: str) -> Iterator[str]:
+    # reqs is sorted by abbrev first, so first-seen order is already the sorted module order.
+    # Resolve and escape each module once; the jump chips and the sections both use it.
+    mods = []
+    for mod in dict.fromkeys(r.abbrev for r in reqs):
+        mi = proj.modules.get(mod)
+        mods.append((mod, escape(mod), escape(mi.name if mi else ''), mi))
+    jump = [f"<a class='chip' href='#mod-{mod_esc}'>{mod_esc} — {name_esc}</a>" for _, mod_esc, name_esc, _ in mods]
+    yield f"""
+            <h1>{escape(lvl)}</h1>
+            <div class='toolbar'><span class='muted small'>Jump to module:</span> {' '.join(jump) if jump else '—'}</div>
+            """
+    for mod, mod_esc, name_esc, mi in mods:
+        yield f"""
+                <section id='mod-{mod_esc}'>
+                  <h2>{mod_esc} — {name_esc}</h2>
                   {module_links_html(mi)}
-                  <input id='tblFilter' placeholder='Filter within {escape(mod)}…' oninput='filterTable(this)' />
+                  <input id='tblFilter' placeholder='Filter within {mod_esc}…' oninput='filterTable(this)' />
                   <div class='table-wrap'>
                     <table class='table'>
                       <thead><tr><th>ExternalID</th><th>Heading</th><th>Text</th><th>Incoming</th><th>Outgoing</th><th>Tests</th></tr></thead>
-                      <tbody>{''.join(rows) or '<tr><td colspan=6>None</td></tr>'}</tbody>
+                      <tbody>"""
+        yield from _rows_or_none((_level_row(proj, r, p) for r in proj.by_module[mod]), '<tr><td colspan=6>None</td></tr>')
+        yield """</tbody>
                     </table>
                   </div>
                 </section>
-                """)
-            body = f"""
-            <h1>{escape(lvl)}</h1>
-            <div class='toolbar'><span class='muted small'>Jump to module:</span> {' '.join(jump) if jump else '—'}</div>
-            {''.join(sections)}
+                """
+    yield """
             """
-            write_text(out_root/level_url(lvl), layout(lvl, body, proj.project_name, proj.levels, depth))
-            continue
-        # Other levels: single consolidated table
-        mi_example = proj.modules.get(reqs[0].abbrev) if reqs else None
-        link_html = module_links_html(mi_example)
-        rows=[]
-        for r in reqs:
-            label,_,_=proj.tests_rollup(r.external_id)
-            def link_html_req(eid: str) -> str:
-                rr = proj.requirements.get(eid)
-                tip = make_tip(rr)
-                return f"<a href='{p}{requirement_url(eid)}' title='{tip}'>{escape(eid)}</a>" if rr else escape(eid)
-            inc = " ".join(link_html_req(e) for e in r.incoming if e in proj.requirements)
-            outs_req=[e for e in r.outgoing if e in proj.requirements]
-            outs_tst=[e for e in r.outgoing if is_test_id(e)]
-            outs_html = (f"<div><strong>Req:</strong> "+", ".join(link_html_req(e) for e in outs_req)+"</div>" if outs_req else "") \
-                        + (f"<div><strong>Tests:</strong> "+", ".join(escape(e) for e in outs_tst)+"</div>" if outs_tst else "")
-            rows.append(
-                f"<tr><td><a href='{p}{requirement_url(r.external_id)}'>{escape(r.external_id)}</a></td>"
-                f"<td>{escape(r.heading)}</td><td>{escape(truncate(r.text,180))}</td>"
-                f"<td>{inc}</td><td>{outs_html}</td><td>{badge(label)}</td></tr>"
-            )
-        body=f"""
+
+def _level_parts(proj: Project, lvl: str, reqs: List[Requirement], p: str) -> Iterator[str]:
+    mi_example = proj.modules.get(reqs[0].abbrev) if reqs else None
+    link_html = module_links_html(mi_example)
+    yield f"""
         <h1>{escape(lvl)}</h1>
         {link_html}
         <input id='tblFilter' placeholder='Filter by ID or text…' oninput='filterTable(this)' />
         <div class='table-wrap'>
           <table class='table'>
             <thead><tr><th>ExternalID</th><th>Heading</th><th>Text</th><th>Incoming</th><th>Outgoing</th><th>Tests</th></tr></thead>
-            <tbody>{''.join(rows)}</tbody>
+            <tbody>"""
+    for r in reqs: yield _level_row(proj, r, p)
+    yield """</tbody>
           </table>
         </div>
         """
-        write_text(out_root/level_url(lvl), layout(lvl, body, proj.project_name, proj.levels, depth))
 
-def render_requirement_pages(proj: Project, out_root: Path) -> None:
-    depth=1; p="../"
-    for r in proj.requirements.values():
-        mi = proj.modules.get(r.abbrev)
-        inc_rows=[]
-        for eid in r.incoming:
-            rr = proj.requirements.get(eid)
-            if rr:
-                tip = make_tip(rr)
-                inc_rows.append(
-                    f"<tr><td><a href='{p}{requirement_url(rr.external_id)}' title='{tip}'>{escape(rr.external_id)}</a></td>"
-                    f"<td>{escape(rr.heading)}</td><td>{escape(truncate(rr.text,200))}</td></tr>"
-                )
-            else:
-                inc_rows.append(f"<tr class='warn'><td>{escape(eid)}</td><td colspan='2'>Broken link</td></tr>")
-        out_rows=[]
-        for eid in r.outgoing:
-            if is_test_id(eid): continue
-            rr = proj.requirements.get(eid)
-            if rr:
-                tip = make_tip(rr)
-                out_rows.append(
-                    f"<tr><td><a href='{p}{requirement_url(rr.external_id)}' title='{tip}'>{escape(rr.external_id)}</a></td>"
-                    f"<td>{escape(rr.heading)}</td><td>{escape(truncate(rr.text,200))}</td></tr>"
-                )
-            else:
-                out_rows.append(f"<tr class='warn'><td>{escape(eid)}</td><td colspan='2'>Broken link</td></tr>")
-        test_rows=[]
-        for tid in [e for e in r.outgoing if is_test_id(e)]:
-            t=proj.tests.get(tid)
-            if t:
-                test_rows.append(
-                    f"<tr><td>{escape(t.external_id)}</td><td>{badge(t.result)}</td><td>{escape(truncate(t.text,160))}</td><td>{escape(truncate(t.additional,160))}</td></tr>"
-                )
-            else:
-                test_rows.append(f"<tr class='warn'><td>{escape(tid)}</td><td colspan='3'>Missing test</td></tr>")
-        label, counts, all_tids = proj.tests_rollup(r.external_id)
-        counts_html = " ".join(f"<span class='chip'>{escape(k)}: {v}</span>" for k,v in counts.items()) or "<span class='chip'>No tests</span>"
-        all_tests_html = ", ".join(escape(tid) for tid in sorted(set(all_tids))) or "—"
-        body=f"""
-        <h1>{escape(r.external_id)} — {escape(r.heading)}</h1>
+def level_page_parts(proj: Project, lvl: str) -> Iterator[str]:
+    reqs = proj.by_level.get(lvl, [])
+    if lvl.strip().lower() == "module":
+        # Module level: separate tables per module
+        return _module_level_parts(proj, lvl, reqs, "../")
+    # Other levels: single consolidated table
+    return _level_parts(proj, lvl, reqs, "../")
+
+def render_level_pages(proj: Project, out_root: Path) -> None:
+    depth=1
+    for lvl in proj.levels:
+        write_layout_stream(out_root/level_url(lvl), lvl, proj.project_name, proj.levels, depth, level_page_parts(proj, lvl))
+
+_BROKEN_XREF_ROW = "<tr class='warn'><td>%s</td><td colspan='2'>Broken link</td></tr>"
+_MISSING_TEST_ROW = "<tr class='warn'><td>%s</td><td colspan='3'>Missing test</td></tr>"
+
+def _xref_rows(proj: Project, eids: Iterable[str], p: str) -> Iterator[str]:
+    get = proj.requirements.get
+    a = "<tr><td><a href='" + p
+    for eid in eids:
+        rr = get(eid)
+        if rr:
+            yield a + rr.xref_tail
+        else:
+            yield _BROKEN_XREF_ROW % escape(eid)
+
+def _test_rows(proj: Project, tids: Iterable[str]) -> Iterator[str]:
+    get = proj.tests.get
+    for tid in tids:
+        t=get(tid)
+        if t:
+            yield t.row_html
+        else:
+            yield _MISSING_TEST_ROW % escape(tid)
+
+def requirement_page_parts(proj: Project, r: Requirement) -> Iterator[str]:
+    """Body of a requirement page as a stream of fragments, one per table row."""
+    p="../"; rid = r.external_id
+    mi = proj.modules.get(r.abbrev)
+    label, counts, all_tids = proj.tests_rollup(rid)
+    counts_html = " ".join([f"<span class='chip'>{escape(k)}: {v}</span>" for k,v in counts.items()]) or "<span class='chip'>No tests</span>"
+    # The separator has nothing to escape, so one translate over the joined IDs equals escaping each.
+    all_tests_html = escape(", ".join(sorted(set(all_tids)))) or "—"
+    yield f"""
+        <h1>{r.eid_esc} — {r.heading_esc}</h1>
         {module_links_html(mi)}
         <p class='muted'>{escape(r.text)}</p>
         <section><h2>Consolidated tests {badge(label)}</h2><div class='counts'>{counts_html}</div><div class='muted small'>All associated tests: {all_tests_html}</div></section>
         <div class='grid'>
-          <section><h3>Incoming (higher-level)</h3><div class='table-wrap'><table class='table'><thead><tr><th>ExternalID</th><th>Heading</th><th>Text</th></tr></thead><tbody>{''.join(inc_rows) or '<tr><td colspan=3>None</td></tr>'}</tbody></table></div></section>
-          <section><h3>Outgoing (lower-level)</h3><div class='table-wrap'><table class='table'><thead><tr><th>ExternalID</th><th>Heading</th><th>Text</th></tr></thead><tbody>{''.join(out_rows) or '<tr><td colspan=3>None</td></tr>'}</tbody></table></div></section>
+          <section><h3>Incoming (higher-level)</h3><div class='table-wrap'><table class='table'><thead><tr><th>ExternalID</th><th>Heading</th><th>Text</th></tr></thead><tbody>"""
+    yield from _rows_or_none(_xref_rows(proj, proj.req_incoming[rid], p), '<tr><td colspan=3>None</td></tr>')
+    yield """</tbody></table></div></section>
+          <section><h3>Outgoing (lower-level)</h3><div class='table-wrap'><table class='table'><thead><tr><th>ExternalID</th><th>Heading</th><th>Text</th></tr></thead><tbody>"""
+    yield from _rows_or_none(_xref_rows(proj, r.out_xref_ids, p), '<tr><td colspan=3>None</td></tr>')
+    yield """</tbody></table></div></section>
         </div>
-        <section><h3>Direct tests linked to this requirement</h3><div class='table-wrap'><table class='table'><thead><tr><th>TestID</th><th>Result</th><th>Test Name</th><th>Notes</th></tr></thead><tbody>{''.join(test_rows) or '<tr><td colspan=4>None</td></tr>'}</tbody></table></div></section>
+        <section><h3>Direct tests linked to this requirement</h3><div class='table-wrap'><table class='table'><thead><tr><th>TestID</th><th>Result</th><th>Test Name</th><th>Notes</th></tr></thead><tbody>"""
+    yield from _rows_or_none(_test_rows(proj, r.out_test_ids), '<tr><td colspan=4>None</td></tr>')
+    yield """</tbody></table></div></section>
         """
-        write_text(out_root/requirement_url(r.external_id), layout(r.external_id, body, proj.project_name, proj.levels, depth))
 
-def render_edit_pages(proj: Project, out_root: Path) -> None:
-    depth=1
-    cards=[]; by_mod: Dict[str, List[Requirement]] = {}
-    for r in proj.requirements.values(): by_mod.setdefault(r.abbrev, []).append(r)
-    for mod, lst in by_mod.items():
-        lst.sort(key=lambda r:(r.sd, int(r.counter) if r.counter.isdigit() else r.counter))
-        cards.append(f"<a class='card' href='../{module_edit_url(mod)}'><h3>{escape(mod)}</h3><p>{len(lst)} requirements</p></a>")
-    body = "<h1>Edit links</h1><p>Inline-edit the <code>OutgoingLinks</code> column, then click <em>Download CSV</em> to export an updated module CSV for DOORS re-import.</p><div class='cards'>"+"".join(cards)+"</div>"
-    write_text(out_root/"edit"/"index.html", layout("Edit links", body, proj.project_name, proj.levels, depth))
+def write_requirement_page(proj: Project, r: Requirement, out_root: str) -> None:
+    write_layout_stream(os.path.join(out_root, r.url), r.external_id, proj.project_name, proj.levels, 1,
+                        requirement_page_parts(proj, r))
+
+# Worker-process state for --jobs > 1, set once per worker so the project is shipped once
+# (and simply inherited under the fork start method).
+_WORKER_PROJ: Optional[Project] = None
+_WORKER_OUT: Optional[str] = None
+_WORKER_BUNDLE = False
+
+def _init_render_worker(proj: Project, out_root: Path, logo_src: Optional[str], bundle: bool) -> None:
+    global _WORKER_PROJ, _WORKER_OUT, _WORKER_BUNDLE, _LOGO_SRC, _SINK
+    _WORKER_PROJ, _WORKER_OUT, _WORKER_BUNDLE, _LOGO_SRC = proj, os.fspath(out_root), bundle, logo_src
+    _SINK = None  # a forked copy of the parent's archive must never be written to
+
+def _page_job(proj: Project, kind: str, key: str) -> Tuple[str, str, Iterator[str]]:
+    """(relative url, title, body parts) for a depth-1 page: a requirement, level or module edit page."""
+    if kind == "req":
+        r = proj.requirements[key]
+        return r.url, r.external_id, requirement_page_parts(proj, r)
+    if kind == "level":
+        return level_url(key), key, level_page_parts(proj, key)
+    return module_edit_url(key), f"Edit {key}", edit_page_parts(proj, key, proj.by_module[key])
+
+def _render_page_worker(job: Tuple[str, str]) -> Optional[Tuple[str, bytes]]:
+    proj = _WORKER_PROJ
+    url, title, parts = _page_job(proj, *job)
+    if _WORKER_BUNDLE:
+        return url, page_bytes(title, proj.project_name, proj.levels, 1, parts)
+    write_layout_stream(os.path.join(_WORKER_OUT, url), title, proj.project_name, proj.levels, 1, parts)
+    return None
+
+def render_pages_parallel(proj: Project, out_root: Path, pages: List[Tuple[str, str]], jobs: int) -> None:
+    """Render independent pages on a process pool; when bundling, workers return bytes and the parent writes the archive."""
+    ctx = multiprocessing.get_context("fork") if sys.platform.startswith("linux") else None
+    with ProcessPoolExecutor(jobs, mp_context=ctx, initializer=_init_render_worker,
+                             initargs=(proj, out_root, _LOGO_SRC, _SINK is not None)) as ex:
+        for res in ex.map(_render_page_worker, pages, chunksize=64):
+            if res is not None: _SINK.write(out_root/res[0], res[1])
 
-    for mod, reqs in by_mod.items():
-        mi = proj.modules.get(mod)
-        rows=[]
-        for r in reqs:
-            rows.append(
-                f"<tr><td>{escape(r.external_id)}</td><td>{escape(r.heading)}</td><td class='wrap'>{escape(r.text)}</td>"
-                f"<td class='code'>{escape(';'.join(r.incoming))}</td>"
-                f"<td class='code' contenteditable='true' data-initial='{escape(';'.join(r.outgoing))}'>{escape(';'.join(r.outgoing))}</td></tr>"
-            )
-        body=f"""
+def render_requirement_pages(proj: Project, out_root: Path) -> None:
+    # --jobs > 1 renders these on the process pool in build_site instead.
+    out_str = os.fspath(out_root)
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as ex:
+        list(ex.map(lambda r: write_requirement_page(proj, r, out_str), proj.requirements.values()))
+
+# Edit-table row: id, heading, text, incoming, outgoing (data-initial), outgoing (cell); all escaped.
+_EDIT_ROW = ("<tr><td>%s</td><td>%s</td><td class='wrap'>%s</td><td class='code'>%s</td>"
+             "<td class='code' contenteditable='true' data-initial='%s'>%s</td></tr>")
+
+def _edit_rows(proj: Project, reqs: Iterable[Requirement]) -> Iterator[str]:
+    incoming = proj.req_incoming; join = ';'.join
+    for r in reqs:
+        outs = escape(join(r.outgoing))
+        yield _EDIT_ROW % (r.eid_esc, r.heading_esc, escape(r.text), escape(join(incoming[r.external_id])), outs, outs)
+
+def edit_page_parts(proj: Project, mod: str, reqs: List[Requirement]) -> Iterator[str]:
+    """Body of a module's link-edit page, streamed row by row."""
+    yield f"""
         <h1>Edit {escape(mod)} links</h1>
-        {module_links_html(mi)}
+        {module_links_html(proj.modules.get(mod))}
         <div class='toolbar'>
           <button class='btn' onclick=\"downloadEditedCSV('reqTable','requirements.csv')\">Download CSV</button>
           <input id='tblFilter' placeholder='Filter…' oninput='filterTable(this)' />
         </div>
         <div class='table-wrap'>
-          <table id='reqTable' class='table'><thead><tr><th>ExternalID</th><th>Heading</th><th>ObjectText</th><th>IncomingLinks</th><th>OutgoingLinks (editable)</th></tr></thead><tbody>{''.join(rows)}</tbody></table>
+          <table id='reqTable' class='table'><thead><tr><th>ExternalID</th><th>Heading</th><th>ObjectText</th><th>IncomingLinks</th><th>OutgoingLinks (editable)</th></tr></thead><tbody>"""
+    yield from _edit_rows(proj, reqs)
+    yield """</tbody></table>
         </div>
         <p class='muted small'>Only the <strong>OutgoingLinks</strong> column is exported as edited; other columns are preserved as shown.</p>
         """
-        write_text(out_root/module_edit_url(mod), layout(f"Edit {mod}", body, proj.project_name, proj.levels, depth))
+
+def render_edit_index(proj: Project, out_root: Path) -> None:
+    cards=[]
+    for mod, lst in proj.by_module.items():
+        cards.append(f"<a class='card' href='../{module_edit_url(mod)}'><h3>{escape(mod)}</h3><p>{len(lst)} requirements</p></a>")
+    body = "<h1>Edit links</h1><p>Inline-edit the <code>OutgoingLinks</code> column, then click <em>Download CSV</em> to export an updated module CSV for DOORS re-import.</p><div class='cards'>"+"".join(cards)+"</div>"
+    write_text(out_root/"edit"/"index.html", layout("Edit links", body, proj.project_name, proj.levels, 1))
+
+def render_edit_pages(proj: Project, out_root: Path) -> None:
+    depth=1
+    render_edit_index(proj, out_root)
+    for mod, reqs in proj.by_module.items():
+        write_layout_stream(out_root/module_edit_url(mod), f"Edit {mod}", proj.project_name, proj.levels, depth,
+                            edit_page_parts(proj, mod, reqs))
 
 # ─────────────────────────── Assets ───────────────────────────
 def write_assets(out_root: Path) -> None:
-    write_text(out_root/"style.css", DEFAULT_CSS)
+    # Shared by every page via <link>/<script src>, so each page carries neither inline.
+    write_text(out_root/"style.css", DEFAULT_CSS + STATS_CSS)
+    write_text(out_root/"script.js", DEFAULT_JS)
 
 DEFAULT_CSS = """:root{--bg:#0b0c10;--surface:#121317;--muted:#9aa0a6;--text:#e5e7eb;--border:#222638;--accent:#60a5fa;--pass:#22c55e;--fail:#ef4444;--warn:#f59e0b;--info:#38bdf8;--shadow:0 6px 18px rgba(0,0,0,.25)}
 :root{transition: background .2s linear, color .2s linear}
@@ -807,38 +1255,97 @@ input#tblFilter{width:100%;padding:12px;border-radius:12px;border:1px solid var(
 """
 
 # ─────────────────────────── Entry point ───────────────────────────
+_LOGO_EXTS = frozenset((".png", ".svg", ".jpg", ".jpeg", ".webp"))
+
 def main():
     ap = argparse.ArgumentParser(description="Generate a static HTML site from DOORS CSVs (v9)")
     ap.add_argument("--exports", type=Path, required=True)
     ap.add_argument("--out", type=Path, required=True)
     ap.add_argument("--project-name", type=str, default="DOORS Project")
     ap.add_argument("--logo", type=Path, default="default.svg")
+    ap.add_argument("--jobs", type=int, default=1, help="worker processes for parsing the exports and rendering level, requirement and edit pages (0 = one per CPU)")
+    ap.add_argument("--bundle", nargs="?", const="zip", choices=sorted(_SINKS),
+                    help="write the site into OUT/site.zip (or OUT/site.tar with --bundle tar) instead of individual files")
+    ap.add_argument("--no-cache", action="store_true", help="always re-parse the exports instead of reusing the per-user project cache")
+    ap.add_argument("--no-edit", action="store_true", help="skip the link-edit pages (read-only sites)")
+    ap.add_argument("--watch", action="store_true", help="keep running and rebuild whenever hierarchy.yaml or a CSV export changes")
     args = ap.parse_args()
 
     hier = args.exports/"hierarchy.yaml"
     if not hier.exists():
         raise SystemExit(f"Missing hierarchy.yaml at {hier}")
-
-    proj = load_project(args.exports, hier, args.project_name)
-
-    global _LOGO_SRC
     if args.logo:
-        assets_dir = args.out / "assets"
-        assets_dir.mkdir(parents=True, exist_ok=True)
         ext = args.logo.suffix.lower()
-        if ext not in {".png", ".svg", ".jpg", ".jpeg", ".webp"}:
+        if ext not in _LOGO_EXTS:
             raise SystemExit(f"Unsupported logo type '{ext}'. Use PNG/SVG/JPG/WEBP.")
-        dest = assets_dir / f"logo{ext}"
-        shutil.copyfile(args.logo, dest)
-        _LOGO_SRC = f"assets/{dest.name}"
 
-    write_assets(args.out)
-    render_index(proj, args.out)
-    render_level_pages(proj, args.out)
-    render_requirement_pages(proj, args.out)
-    render_edit_pages(proj, args.out)
+    build_site(args, hier)
+    if args.watch:
+        watch_exports(args, hier)
+
+def build_site(args: argparse.Namespace, hier: Path) -> None:
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    proj = (load_project if args.no_cache else load_project_cached)(args.exports, hier, args.project_name, jobs)
+
+    global _LOGO_SRC, _SINK
+    _DIRS_CREATED.clear()  # --watch: OUT may have been cleaned since the last build
+    if args.bundle:
+        _SINK = _SINKS[args.bundle](args.out/f"site.{args.bundle}", args.out)
 
-    print(f"Site generated at: {args.out}")
+    try:
+        if args.logo:
+            dest = args.out / "assets" / f"logo{args.logo.suffix.lower()}"
+            copy_asset(args.logo, dest)
+            _LOGO_SRC = f"assets/{dest.name}"
+
+        write_assets(args.out)
+        render_index(proj, args.out)
+        if jobs > 1:
+            # One pool for every depth-1 page kind, so workers start (and receive the project) once.
+            # Level pages are the largest, so they go first and don't trail at the end of the run.
+            if not args.no_edit: render_edit_index(proj, args.out)
+            render_pages_parallel(proj, args.out, [("level", lvl) for lvl in proj.levels]
+                                  + [("req", rid) for rid in proj.requirements]
+                                  + ([] if args.no_edit else [("edit", mod) for mod in proj.by_module]), jobs)
+        else:
+            render_level_pages(proj, args.out)
+            render_requirement_pages(proj, args.out)
+            if not args.no_edit: render_edit_pages(proj, args.out)
+    finally:
+        if _SINK is not None: _SINK.close()
+        _SINK = None
+
+    print(f"Site generated at: {args.out/f'site.{args.bundle}' if args.bundle else args.out}")
+
+def _exports_stamp(exports_root: Path, hier: Path) -> Set[Tuple[str, int, int]]:
+    """(path, mtime_ns, size) of every input; cheap enough to poll, unlike hashing the files."""
+    stamp = set()
+    for e in [hier, *_iter_csv_entries(str(exports_root))]:
+        try:
+            st = e.stat()
+        except OSError:
+            continue  # deleted between listing and stat
+        stamp.add((os.fspath(e), st.st_mtime_ns, st.st_size))
+    return stamp
+
+def watch_exports(args: argparse.Namespace, hier: Path, interval: float = 1.0) -> None:
+    """Poll the exports and rebuild whenever they change, in this process so imports and caches stay warm."""
+    print(f"Watching {args.exports} for changes (Ctrl+C to stop)")
+    seen = _exports_stamp(args.exports, hier)
+    try:
+        while True:
+            time.sleep(interval)
+            now = _exports_stamp(args.exports, hier)
+            if now == seen: continue
+            seen = now
+            try:
+                build_site(args, hier)
+            except Exception as e:
+                # Usually an export caught half-written (csv.Error, a partial YAML structure, a worker
+                # dying with BrokenProcessPool, ...); the next change triggers another build.
+                print(f"Rebuild failed: {type(e).__name__}: {e}", file=sys.stderr)
+    except KeyboardInterrupt:
+        pass
 
 if __name__ == "__main__":
     main()
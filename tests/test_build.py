@@ -0,0 +1,30 @@
+import contextlib, io, os, sys, tempfile, unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"src"))
+import generate_site as gs  # noqa: E402
+
+
+class BuildSiteTest(unittest.TestCase):
+    def test_build_into_current_directory(self):
+        # "--out ." puts index.html, style.css and script.js at dirname "".
+        with tempfile.TemporaryDirectory() as tmp:
+            cwd = os.getcwd()
+            os.chdir(tmp)
+            try:
+                argv = ["generate_site.py", "--exports", str(ROOT/"exports"), "--out", ".",
+                        "--logo", str(ROOT/"src"/"default.svg"), "--no-cache"]
+                with mock.patch.object(sys, "argv", argv), \
+                     mock.patch.object(gs, "project_cache_dir", lambda: Path(tmp)/".cache"), \
+                     contextlib.redirect_stdout(io.StringIO()):
+                    gs.main()
+            finally:
+                os.chdir(cwd)
+            for name in ("index.html", "style.css", "script.js", "assets/logo.svg"):
+                self.assertTrue((Path(tmp)/name).is_file(), name)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,150 @@
+import random, subprocess, sys, tempfile, unittest
+from collections import Counter
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"src"))
+import generate_site as gs  # noqa: E402
+
+
+def make_project(links, test_results=None):
+    """Project from {rid: [outgoing ids]} and {test id: result}; requirements are MOD-R-n, tests MOD-AT-n."""
+    reqs = {}
+    for rid, outs in links.items():
+        mod, sd, counter = gs.parse_external_id(rid)
+        reqs[rid] = gs.Requirement(external_id=rid, abbrev=mod, sd=sd, counter=counter,
+                                   heading="", text="", outgoing=tuple(outs))
+    tests = {}
+    for tid, result in (test_results or {}).items():
+        mod, _, counter = gs.parse_external_id(tid)
+        tests[tid] = gs.TestCase(external_id=tid, abbrev=mod, counter=counter, text="", result=result)
+    proj = gs.Project(project_name="T", levels=[], modules={}, requirements=reqs, tests=tests)
+    proj.build_graph()
+    return proj
+
+
+def reachable(proj, rid):
+    """Brute force: requirements reachable over one or more child edges (rid itself only via a cycle)."""
+    seen, todo = set(), list(proj.req_children[rid])
+    while todo:
+        v = todo.pop()
+        if v not in seen:
+            seen.add(v); todo.extend(proj.req_children[v])
+    return seen
+
+
+def brute_rollup(proj, rid):
+    ids = list(proj.req_tests[rid])
+    for d in reachable(proj, rid): ids.extend(proj.req_tests[d])
+    counts = Counter(((proj.tests[t].result.strip() or "Not Run") if t in proj.tests else "Missing") for t in ids)
+    return gs.summarize_counts(counts, len(ids)), counts, sorted(ids)
+
+
+# Self-link (R-1), 2-node cycle (R-2 <-> R-3), diamond (R-4 -> R-5, R-6 -> R-7), disconnected (R-8),
+# a broken link (R-7 -> R-9) and R-10 reaching both the diamond tail and the cycle.
+GRAPH = {
+    "X-R-1": ["X-R-1", "X-AT-1"],
+    "X-R-2": ["X-R-3"],
+    "X-R-3": ["X-R-2", "X-AT-2"],
+    "X-R-4": ["X-R-5", "X-R-6"],
+    "X-R-5": ["X-R-7", "X-AT-3"],
+    "X-R-6": ["X-R-7", "X-AT-4"],
+    "X-R-7": ["X-AT-5", "X-R-9"],
+    "X-R-8": [],
+    "X-R-10": ["X-R-7", "X-R-2"],
+}
+RESULTS = {"X-AT-1": "PASSED", "X-AT-2": "FAILED", "X-AT-3": "PASSED", "X-AT-4": "", "X-AT-5": "PASSED"}
+
+
+class DescendantsTest(unittest.TestCase):
+    def test_small_graph(self):
+        proj = make_project(GRAPH, RESULTS)
+        d = proj.descendants
+        self.assertEqual(d("X-R-1"), {"X-R-1"})                        # self-link
+        self.assertEqual(d("X-R-2"), {"X-R-2", "X-R-3"})               # 2-node cycle
+        self.assertEqual(d("X-R-3"), {"X-R-2", "X-R-3"})
+        self.assertEqual(d("X-R-4"), {"X-R-5", "X-R-6", "X-R-7"})      # diamond
+        self.assertEqual(d("X-R-7"), set())                             # broken link is not a child
+        self.assertEqual(d("X-R-8"), set())                             # disconnected
+        self.assertEqual(d("X-R-10"), {"X-R-7", "X-R-2", "X-R-3"})
+        self.assertEqual(d("NOPE-R-1"), set())
+
+    def test_random_graphs_match_brute_force(self):
+        rnd = random.Random(1234)
+        for _ in range(200):
+            n = rnd.randint(1, 25)
+            ids = [f"M-R-{i}" for i in range(n)]
+            links = {rid: rnd.sample(ids, rnd.randint(0, min(3, n))) for rid in ids}
+            proj = make_project(links)
+            for rid in ids:
+                self.assertEqual(proj.descendants(rid), reachable(proj, rid), (links, rid))
+
+    def test_descendants_cannot_be_mutated(self):
+        proj = make_project(GRAPH, RESULTS)
+        self.assertIsInstance(proj.descendants("X-R-2"), frozenset)
+        with self.assertRaises(AttributeError):
+            proj.descendants("X-R-2").add("X-R-8")
+
+
+class TestsRollupTest(unittest.TestCase):
+    def test_small_graph(self):
+        proj = make_project(GRAPH, RESULTS)
+        for rid in GRAPH:
+            label, counts, ids = proj.tests_rollup(rid)
+            self.assertEqual((label, Counter(counts), sorted(ids)), brute_rollup(proj, rid), rid)
+        # Diamond: the shared child's test is counted once.
+        self.assertEqual(proj.tests_rollup("X-R-4")[1], Counter({"PASSED": 2, "Not Run": 1}))
+        self.assertEqual(proj.tests_rollup("X-R-8")[0], "No Tests")
+
+    def test_missing_test_is_counted(self):
+        proj = make_project({"Y-R-1": ["Y-AT-1", "Y-AT-2"]}, {"Y-AT-1": "PASSED"})
+        self.assertEqual(proj.tests_rollup("Y-R-1")[1], Counter({"PASSED": 1, "Missing": 1}))
+
+    def test_random_graphs_match_brute_force(self):
+        rnd = random.Random(99)
+        results = ["PASSED", "FAILED", "PARTIAL", "", "NOT TESTED"]
+        for _ in range(200):
+            n = rnd.randint(1, 20)
+            ids = [f"M-R-{i}" for i in range(n)]
+            tids = [f"M-AT-{i}" for i in range(n)]
+            links = {rid: rnd.sample(ids, rnd.randint(0, min(3, n))) + rnd.sample(tids, rnd.randint(0, min(2, n)))
+                     for rid in ids}
+            proj = make_project(links, {t: rnd.choice(results) for t in tids if rnd.random() < .8})
+            for rid in ids:
+                label, counts, got = proj.tests_rollup(rid)
+                self.assertEqual((label, Counter(counts), sorted(got)), brute_rollup(proj, rid), (links, rid))
+
+
+class ReadCsvRowsSelectTest(unittest.TestCase):
+    def rows(self, text, wanted, defaults=None):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp)/"m.csv"
+            path.write_bytes(text.encode("utf-8-sig"))
+            return list(gs.read_csv_rows_select(path, wanted, defaults))
+
+    def test_all_columns_present(self):
+        # Fast path (itemgetter) for full rows; short and blank rows take the per-column path.
+        text = ' A , B ,C\n 1 , 2 , 3 \nx,y\n\n"q, r",s,t\n'
+        self.assertEqual(self.rows(text, ("C", "A")), [("3", "1"), ("", "x"), ("t", "q, r")])
+
+    def test_missing_column_uses_default(self):
+        text = "A,B\n1,2\n"
+        self.assertEqual(self.rows(text, ("B", "Z", "A"), {"Z": "dflt"}), [("2", "dflt", "1")])
+        self.assertEqual(self.rows(text, ("Z",)), [("",)])
+
+    def test_single_column_and_empty_file(self):
+        self.assertEqual(self.rows("A,B\n1,2\n", ("B",)), [("2",)])
+        self.assertEqual(self.rows("", ("A",)), [])
+
+    def test_field_larger_than_csv_default(self):
+        text = "A,B\n1,\"" + "x" * 300_000 + "\"\n"
+        self.assertEqual(self.rows(text, ("A", "B")), [("1", "x" * 300_000)])
+
+    def test_import_leaves_csv_field_limit_alone(self):
+        code = f"import csv, sys; sys.path.insert(0, {str(ROOT/'src')!r}); import generate_site; print(csv.field_size_limit())"
+        out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        self.assertEqual(int(out), 128 * 1024)  # csv's own default
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+import argparse, contextlib, io, shutil, sys, tempfile, unittest
+from pathlib import Path
+from unittest import mock
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT/"src"))
+import generate_site as gs  # noqa: E402
+
+REQ_CSV = ("Object Heading,DataClass,Object Identifier,Object Text,Outgoing Links\n"
+           ",Mandatory,URS-R-1,The system shall work.,SYS-R-1\n"
+           ",Mandatory,SYS-R-1,The system shall really work.,\n")
+
+
+class WatchExportsTest(unittest.TestCase):
+    def test_watch_survives_half_written_exports(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp = Path(tmp)
+            exports = tmp/"exports"; (exports/"doors_exports").mkdir(parents=True)
+            hier = exports/"hierarchy.yaml"
+            shutil.copyfile(ROOT/"exports"/"hierarchy.yaml", hier)
+            csv_path = exports/"doors_exports"/"URS Specification.csv"
+            csv_path.write_text(REQ_CSV, encoding="utf-8")
+            args = argparse.Namespace(exports=exports, out=tmp/"site", project_name="Watch", logo=None,
+                                      jobs=1, bundle=None, no_cache=True, no_edit=False, watch=True)
+            good_yaml = hier.read_bytes()
+
+            # One change per poll: a NUL-containing CSV, a truncated YAML (partial structure), the
+            # YAML restored, then Ctrl+C.
+            steps = iter([
+                lambda: csv_path.write_text(REQ_CSV[:120] + "\0" + REQ_CSV[120:-20], encoding="utf-8"),
+                lambda: hier.write_bytes(b"levels: [A]\nmodules:\n  - name"),
+                lambda: hier.write_bytes(good_yaml),
+            ])
+            def fake_sleep(_interval):
+                step = next(steps, None)
+                if step is None: raise KeyboardInterrupt
+                step()
+
+            err = io.StringIO()
+            with mock.patch.object(gs.time, "sleep", fake_sleep), \
+                 mock.patch.object(gs, "project_cache_dir", lambda: tmp/"cache"), \
+                 mock.patch.object(gs, "build_site", wraps=gs.build_site) as build, \
+                 contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(err):
+                gs.watch_exports(args, hier)
+
+            self.assertEqual(build.call_count, 3)
+            self.assertEqual(err.getvalue().count("Rebuild failed"), 1)
+            self.assertIn("TypeError", err.getvalue())
+            self.assertTrue((tmp/"site"/"index.html").exists())
+
+
+if __name__ == "__main__":
+    unittest.main()